@@ -22,7 +22,7 @@ Module for storing dataset info (e.g. general meta data or categories)
 from copy import copy
 from dataclasses import dataclass, field
 from itertools import chain
-from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Set, Union, no_type_check, overload
+from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple, Union, no_type_check, overload
 
 from ..utils.settings import DefaultType, ObjectTypes, TypeOrStr, get_type
 from ..utils.utils import call_only_once
@@ -58,9 +58,10 @@ def _get_dict(
     :param starts_with: index count start
     :return: A dictionary of list indices/list elements.
     """
+    indices = map(str, range(starts_with, starts_with + len(l)))
     if name_as_key:
-        return {v: str(k) for k, v in enumerate(l, starts_with)}
-    return {str(k): v for k, v in enumerate(l, starts_with)}
+        return dict(zip(l, indices))
+    return dict(zip(indices, l))
 
 
 @dataclass
@@ -135,11 +136,24 @@ class DatasetCategories:
     init_sub_categories: Mapping[ObjectTypes, Mapping[ObjectTypes, Sequence[ObjectTypes]]] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
+        self._cat_cache: Dict[Tuple[bool, bool, bool, bool], Any] = {}
         self._categories_update = self.init_categories
+        self._categories_filter_update: Optional[Sequence[ObjectTypes]] = None
         self._cat_to_sub_cat: Optional[Mapping[ObjectTypes, ObjectTypes]] = None
+        self._sub_cat_to_cat: Dict[ObjectTypes, ObjectTypes] = {}
         self._allow_update = True
         self._init_sanity_check()
 
+    @property
+    def _categories_update(self) -> Sequence[ObjectTypes]:
+        return self._categories_update_seq
+
+    @_categories_update.setter
+    def _categories_update(self, categories: Sequence[ObjectTypes]) -> None:
+        # categories returned by get_categories depend on the updated categories and must be re-computed
+        self._categories_update_seq = categories  # pylint: disable=W0201
+        self._cat_cache.clear()
+
     @overload
     def get_categories(
         self, *, name_as_key: Literal[True], init: bool = ..., filtered: bool = ...
@@ -181,16 +195,26 @@ class DatasetCategories:
                          invoked selected sub categories will be returned.
         :return: A dict of index/category names (or the other way around) or a list of category names.
         """
+        cache_key = (as_dict, name_as_key, init, filtered)
+        if cache_key not in self._cat_cache:
+            self._cat_cache[cache_key] = self._get_categories(as_dict, name_as_key, init, filtered)
+        if as_dict:
+            return dict(self._cat_cache[cache_key])
+        return list(self._cat_cache[cache_key])
+
+    def _get_categories(
+        self, as_dict: bool, name_as_key: bool, init: bool, filtered: bool
+    ) -> Union[Sequence[ObjectTypes], Mapping[ObjectTypes, str], Mapping[str, ObjectTypes]]:
         if init:
             if as_dict:
                 return _get_dict(self.init_categories, name_as_key)
             return list(copy(self.init_categories))
         if filtered:
             if as_dict:
-                if hasattr(self, "_categories_filter_update"):
+                if self._categories_filter_update is not None:
                     return _get_dict(self._categories_filter_update, name_as_key)
                 return _get_dict(self._categories_update, name_as_key)
-            if hasattr(self, "_categories_filter_update"):
+            if self._categories_filter_update is not None:
                 return self._categories_filter_update
             return list(copy(self._categories_update))
         if as_dict:
@@ -230,23 +254,15 @@ class DatasetCategories:
             sub_categories = {}
 
         sub_cat: Dict[ObjectTypes, Union[ObjectTypes, List[ObjectTypes]]] = {}
+        filtered_categories = set(self.get_categories(as_dict=False, filtered=True))
         for cat in _categories:
-            assert cat in self.get_categories(  # pylint: disable=E1135
-                as_dict=False, filtered=True
-            ), f"{cat} not in categories. Maybe it has been replaced with sub category"
+            assert cat in filtered_categories, f"{cat} not in categories. Maybe it has been replaced with sub category"
             sub_cat_dict = self.init_sub_categories.get(cat)
             if sub_cat_dict is None:
-                if self._cat_to_sub_cat:
-                    for key, val in self._cat_to_sub_cat.items():
-                        possible_sub_cats = self.init_sub_categories[key]
-                        for pos in possible_sub_cats:
-                            if pos == val:
-                                sub_cat_dict_key = self.init_sub_categories[key]
-                                sub_cat_list = sub_cat_dict_key.get(cat)
-                                if sub_cat_list is None:
-                                    sub_cat[cat] = []
-                                else:
-                                    sub_cat[cat] = list(copy(sub_cat_list))
+                if self._sub_cat_to_cat:
+                    owning_cat = self._sub_cat_to_cat.get(cat)
+                    sub_cat_list = self.init_sub_categories[owning_cat].get(cat) if owning_cat is not None else None
+                    sub_cat[cat] = [] if sub_cat_list is None else list(copy(sub_cat_list))
             else:
                 sub_cat[cat] = list(sub_cat_dict.keys())
         if not keys:
@@ -314,6 +330,14 @@ class DatasetCategories:
             for cat in categories  # pylint: disable=E1133
         ]
         self._cat_to_sub_cat = _cat_to_sub_cat
+        # reverse index: every category that has been replaced with a sub category value points to the category it
+        # originates from
+        self._sub_cat_to_cat = {
+            sub_cat_val: cat
+            for cat, sub_cat_key in _cat_to_sub_cat.items()
+            if sub_cat_key in self.init_sub_categories.get(cat, {})
+            for sub_cat_val in self.init_sub_categories[cat][sub_cat_key]
+        }
         _categories_update_list = list(chain(*cats_or_sub_cats))
 
         # we must keep the order of _categories_update_list if the elements are unique
@@ -334,13 +358,12 @@ class DatasetCategories:
         if not self._allow_update:
             raise PermissionError("Filtering categories is not allowed")
         if isinstance(categories, (ObjectTypes, str)):
-            categories = [get_type(categories)]
+            categories_set = {get_type(categories)}
         else:
-            categories = [get_type(category) for category in categories]
+            categories_set = {get_type(category) for category in categories}
 
-        self._categories_filter_update: Sequence[ObjectTypes] = [
-            cat for cat in self._categories_update if cat in categories
-        ]
+        self._categories_filter_update = [cat for cat in self._categories_update if cat in categories_set]
+        self._cat_cache.clear()
 
     @property
     def cat_to_sub_cat(self) -> Optional[Mapping[ObjectTypes, ObjectTypes]]:
@@ -361,9 +384,7 @@ class DatasetCategories:
         """
         return `True` if categories are filtered
         """
-        if hasattr(self, "_categories_filter_update"):
-            return True
-        return False
+        return self._categories_filter_update is not None
 
     def _init_sanity_check(self) -> None:
         # all values of possible sub categories must be listed
@@ -384,41 +405,33 @@ def get_merged_categories(*categories: DatasetCategories) -> DatasetCategories:
     :return: An instance of `DatasetCategories` to be used as `DatasetCategories` for merged datasets
     """
 
-    # working with lists is not possible as the order of categories is important here
-    init_categories = []
-    categories_update = []
-    categories_filtered = []
-    for cat in categories:
-        for label in cat.init_categories:
-            if label not in init_categories:
-                init_categories.append(label)
-        for label in cat.get_categories(as_dict=False):
-            if label not in categories_update:
-                categories_update.append(label)
-        for label in cat.get_categories(as_dict=False, filtered=True):
-            if label not in categories_filtered:
-                categories_filtered.append(label)
+    # working with sets is not possible as the order of categories is important here. dict.fromkeys removes
+    # duplicates while keeping the insertion order
+    init_categories = list(dict.fromkeys(chain.from_iterable(cat.init_categories for cat in categories)))
+    categories_update = list(
+        dict.fromkeys(chain.from_iterable(cat.get_categories(as_dict=False) for cat in categories))
+    )
+    categories_filtered = list(
+        dict.fromkeys(chain.from_iterable(cat.get_categories(as_dict=False, filtered=True) for cat in categories))
+    )
 
     # select categories with sub categories. Only categories that appear in this list can be candidates for having
     # sub categories in the merged dataset
-    intersect_sub_cat_keys = set(categories[0].init_sub_categories.keys()).intersection(
-        *[cat.init_sub_categories.keys() for cat in categories[1:]]
-    )
+    # intersecting is cheapest when starting with the smallest set
+    sub_cat_keys = sorted((set(cat.init_sub_categories) for cat in categories), key=len)
+    intersect_sub_cat_keys = sub_cat_keys[0].intersection(*sub_cat_keys[1:])
     intersect_init_sub_cat = {}
     for key in intersect_sub_cat_keys:
         # select all sub categories from all datasets for a given key
-        sub_cat_per_key = [cat.init_sub_categories[key] for cat in categories]
+        sub_cat_per_key = sorted((set(cat.init_sub_categories[key]) for cat in categories), key=len)
         # select only sub categories that appear in all datasets
-        intersect_sub_cat_per_key = set(sub_cat_per_key[0].keys()).intersection(
-            *[sub_cats.keys() for sub_cats in sub_cat_per_key[1:]]
-        )
+        intersect_sub_cat_per_key = sub_cat_per_key[0].intersection(*sub_cat_per_key[1:])
         # form a set of possible sub category values. To get a list of all values from all dataset, take the union
         intersect_init_sub_cat_values = {}
         for sub_cat_key in intersect_sub_cat_per_key:
-            val: Set[ObjectTypes] = set()
-            for cat in categories:
-                val.update(cat.init_sub_categories[key][sub_cat_key])
-            intersect_init_sub_cat_values[sub_cat_key] = list(val)
+            intersect_init_sub_cat_values[sub_cat_key] = set(
+                chain.from_iterable(cat.init_sub_categories[key][sub_cat_key] for cat in categories)
+            )
         intersect_init_sub_cat[key] = intersect_init_sub_cat_values
 
     # Building sub cats such that the result is deterministic. Because we use sets in several occasions above the
@@ -443,5 +456,6 @@ def get_merged_categories(*categories: DatasetCategories) -> DatasetCategories:
     merged_categories = DatasetCategories(init_categories=init_categories, init_sub_categories=init_sub_cat)
     merged_categories._categories_update = categories_update  # pylint: disable = W0212
     merged_categories._allow_update = False  # pylint: disable = W0212
-    setattr(merged_categories, "_categories_filter_update", categories_filtered)
+    merged_categories._categories_filter_update = categories_filtered  # pylint: disable = W0212
+    merged_categories._cat_cache.clear()  # pylint: disable = W0212
     return merged_categories
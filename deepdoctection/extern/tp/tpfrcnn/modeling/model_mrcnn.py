@@ -10,6 +10,7 @@ This file is modified from
 """
 
 # pylint: disable=import-error
+import numpy as np
 import tensorflow as tf
 from tensorpack.models import Conv2D, Conv2DTranspose, layer_register
 from tensorpack.tfutils.argscope import argscope
@@ -21,6 +22,14 @@ from .backbone import GroupNorm
 
 # pylint: enable=import-error
 
+# Row i holds the 8 bits of the byte value i (most significant bit first). Kept as numpy array rather than tf.constant,
+# so that it is not bound to the graph that happens to be the default one at import time.
+_UNPACK_LUT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.bool_)
+
+# The TF version does not change during the lifetime of the process
+_TF_GE_1_12 = get_tf_version_tuple() >= (1, 12)
+_TF_GE_1_14 = get_tf_version_tuple() >= (1, 14)
+
 
 @under_name_scope()
 def maskrcnn_loss(mask_logits, fg_labels, fg_target_masks):
@@ -30,17 +39,16 @@ def maskrcnn_loss(mask_logits, fg_labels, fg_target_masks):
     :param fg_target_masks: #fgxhxw, float32
     """
 
-    if get_tf_version_tuple() >= (1, 14):
-        mask_logits = tf.gather(mask_logits, tf.reshape(fg_labels - 1, [-1, 1]), batch_dims=1)
-        mask_logits = tf.squeeze(mask_logits, axis=1)
+    if _TF_GE_1_14:
+        mask_logits = tf.gather(mask_logits, fg_labels - 1, batch_dims=1)  # #fg x h x w
     else:
         indices = tf.stack([tf.range(tf.size(fg_labels, out_type=tf.int64)), fg_labels - 1], axis=1)  # #fgx2
         mask_logits = tf.gather_nd(mask_logits, indices)  # #fg x h x w
 
-    mask_probs = tf.sigmoid(mask_logits)
-
-    # add some training visualizations to tensorboard
+    # add some training visualizations to tensorboard. mask_probs is only consumed by the image summary, so these ops
+    # are only evaluated on steps where summaries are written
     with tf.name_scope("mask_viz"):
+        mask_probs = tf.sigmoid(mask_logits)
         viz = tf.concat([fg_target_masks, mask_probs], axis=1)
         viz = tf.expand_dims(viz, 3)
         viz = tf.cast(viz * 255, tf.uint8, name="viz")
@@ -49,7 +57,7 @@ def maskrcnn_loss(mask_logits, fg_labels, fg_target_masks):
     loss = tf.nn.sigmoid_cross_entropy_with_logits(labels=fg_target_masks, logits=mask_logits)
     loss = tf.reduce_mean(loss, name="maskrcnn_loss")
 
-    pred_label = mask_probs > 0.5
+    pred_label = mask_logits > 0.0  # same as sigmoid(mask_logits) > 0.5
     truth_label = fg_target_masks > 0.5
     accuracy = tf.reduce_mean(tf.cast(tf.equal(pred_label, truth_label), tf.float32), name="accuracy")
     pos_accuracy = tf.logical_and(tf.equal(pred_label, truth_label), tf.equal(truth_label, True))
@@ -80,10 +88,12 @@ def maskrcnn_upXconv_head(feature, num_category, num_convs, norm=None, **kwargs)
         kernel_initializer=tf.variance_scaling_initializer(
             scale=2.0,
             mode="fan_out",
-            distribution="untruncated_normal" if get_tf_version_tuple() >= (1, 12) else "normal",
+            distribution="untruncated_normal" if _TF_GE_1_12 else "normal",
         ),
     ):
         # c2's MSRAFill is fan_out
+        # Unlike the FPN convs, these convs keep their bias with norm="GN": the bias is added before the ReLU and
+        # therefore is not cancelled by the GroupNorm that follows.
         for k in range(num_convs):
             l = Conv2D(f"fcn{k}", l, cfg.MRCNN.HEAD_DIM, 3, activation=tf.nn.relu)
             if norm is not None:
@@ -117,7 +127,6 @@ def unpackbits_masks(masks):
     """
 
     assert masks.dtype == tf.uint8, masks
-    bits = tf.constant((128, 64, 32, 16, 8, 4, 2, 1), dtype=tf.uint8)
-    unpacked = tf.bitwise.bitwise_and(tf.expand_dims(masks, -1), bits) > 0
+    unpacked = tf.gather(_UNPACK_LUT, tf.cast(masks, tf.int32))
     unpacked = tf.reshape(unpacked, tf.concat([tf.shape(masks)[:-1], [8 * tf.shape(masks)[-1]]], axis=0))
     return unpacked
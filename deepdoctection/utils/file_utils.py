@@ -8,6 +8,7 @@
 Utilities for maintaining dependencies and dealing with external library packages. Parts of this file is adapted from
 <https://github.com/huggingface/transformers/blob/master/src/transformers/file_utils.py>
 """
+import functools
 import importlib.util
 import multiprocessing as mp
 import string
@@ -16,22 +17,38 @@ import sys
 from os import environ, path
 from shutil import which
 from types import ModuleType
-from typing import Any, Tuple, Union, no_type_check
+from typing import Any, Optional, Tuple, Union, no_type_check
 
-import importlib_metadata
 from packaging import version
 
 from .detection_types import Requirement
 from .logger import logger
 from .metacfg import AttrDict
 
-# Tensorflow and Tensorpack dependencies
-_TF_AVAILABLE = False
 
-try:
-    _TF_AVAILABLE = importlib.util.find_spec("tensorflow") is not None
-except ValueError:
-    pass
+def _has_package(package_name: str) -> bool:
+    """
+    Returns True if a package can be found on `sys.path`
+
+    :param package_name: top level package/module name, e.g. "tensorflow"
+    """
+    try:
+        return importlib.util.find_spec(package_name) is not None
+    except ValueError:
+        return False
+
+
+def _has_executable(command: str) -> bool:
+    """
+    Returns True if an executable can be found on `PATH`
+
+    :param command: name of the executable, e.g. "tesseract"
+    """
+    return which(command) is not None
+
+
+# Tensorflow and Tensorpack dependencies
+_TF_AVAILABLE: Optional[bool] = None
 
 _TF_ERR_MSG = "Tensorflow >=2.4.1 must be installed: <https://www.tensorflow.org/install/gpu>"
 
@@ -40,13 +57,19 @@ def tf_available() -> bool:
     """
     Returns True if TF is installed
     """
-    return bool(_TF_AVAILABLE)
+    global _TF_AVAILABLE  # pylint: disable=W0603
+    if _TF_AVAILABLE is None:
+        _TF_AVAILABLE = _has_package("tensorflow")
+    return _TF_AVAILABLE
 
 
+@functools.lru_cache(maxsize=1)
 def get_tf_version() -> str:
     """
     Determine the TF version which is installed
     """
+    import importlib_metadata  # pylint: disable=C0415
+
     tf_version = "0.0"
     if tf_available():
         candidates: Tuple[str, ...] = (
@@ -88,7 +111,7 @@ def get_tensorflow_requirement() -> Requirement:
     return "tensorflow", tf_requirement_satisfied, _TF_ERR_MSG
 
 
-_TF_ADDONS_AVAILABLE = importlib.util.find_spec("tensorflow_addons") is not None
+_TF_ADDONS_AVAILABLE: Optional[bool] = None
 _TF_ADDONS_ERR_MSG = (
     "Tensorflow Addons must be installed: https://www.tensorflow.org/addons/overview or"
     " >> pip install tensorflow-addons"
@@ -99,7 +122,10 @@ def tf_addons_available() -> bool:
     """
     Returns True if tensorflow addons is installed
     """
-    return bool(_TF_ADDONS_AVAILABLE)
+    global _TF_ADDONS_AVAILABLE  # pylint: disable=W0603
+    if _TF_ADDONS_AVAILABLE is None:
+        _TF_ADDONS_AVAILABLE = _has_package("tensorflow_addons")
+    return _TF_ADDONS_AVAILABLE
 
 
 def get_tf_addons_requirements() -> Requirement:
@@ -109,7 +135,7 @@ def get_tf_addons_requirements() -> Requirement:
     return "tensorflow-addons", tf_addons_available(), _TF_ADDONS_ERR_MSG
 
 
-_TP_AVAILABLE = importlib.util.find_spec("tensorpack") is not None
+_TP_AVAILABLE: Optional[bool] = None
 _TP_ERR_MSG = (
     "Tensorflow models all use the Tensorpack modeling API. Therefore, Tensorpack must be installed: "
     ">>make install-dd-tf"
@@ -120,7 +146,10 @@ def tensorpack_available() -> bool:
     """
     Returns True if Tensorpack is installed
     """
-    return bool(_TP_AVAILABLE)
+    global _TP_AVAILABLE  # pylint: disable=W0603
+    if _TP_AVAILABLE is None:
+        _TP_AVAILABLE = _has_package("tensorpack")
+    return _TP_AVAILABLE
 
 
 def get_tensorpack_requirement() -> Requirement:
@@ -131,7 +160,7 @@ def get_tensorpack_requirement() -> Requirement:
 
 
 # Pytorch related dependencies
-_PYTORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+_PYTORCH_AVAILABLE: Optional[bool] = None
 _PYTORCH_ERR_MSG = "Pytorch must be installed: https://pytorch.org/get-started/locally/#linux-pip"
 
 
@@ -139,7 +168,10 @@ def pytorch_available() -> bool:
     """
     Returns True if Pytorch is installed
     """
-    return bool(_PYTORCH_AVAILABLE)
+    global _PYTORCH_AVAILABLE  # pylint: disable=W0603
+    if _PYTORCH_AVAILABLE is None:
+        _PYTORCH_AVAILABLE = _has_package("torch")
+    return _PYTORCH_AVAILABLE
 
 
 def get_pytorch_requirement() -> Requirement:
@@ -150,7 +182,7 @@ def get_pytorch_requirement() -> Requirement:
 
 
 # lxml
-_LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+_LXML_AVAILABLE: Optional[bool] = None
 _LXML_ERR_MSG = "lxml must be installed: pip install lxml"
 
 
@@ -158,7 +190,10 @@ def lxml_available() -> bool:
     """
     Returns True if lxml is installed
     """
-    return bool(_LXML_AVAILABLE)
+    global _LXML_AVAILABLE  # pylint: disable=W0603
+    if _LXML_AVAILABLE is None:
+        _LXML_AVAILABLE = _has_package("lxml")
+    return _LXML_AVAILABLE
 
 
 def get_lxml_requirement() -> Requirement:
@@ -169,7 +204,7 @@ def get_lxml_requirement() -> Requirement:
 
 
 # apted
-_APTED_AVAILABLE = importlib.util.find_spec("apted") is not None
+_APTED_AVAILABLE: Optional[bool] = None
 _APTED_ERR_MSG = "APTED must be installed: pip install apted"
 
 
@@ -177,7 +212,10 @@ def apted_available() -> bool:
     """
     Returns True if apted available
     """
-    return bool(_APTED_AVAILABLE)
+    global _APTED_AVAILABLE  # pylint: disable=W0603
+    if _APTED_AVAILABLE is None:
+        _APTED_AVAILABLE = _has_package("apted")
+    return _APTED_AVAILABLE
 
 
 def get_apted_requirement() -> Requirement:
@@ -188,7 +226,7 @@ def get_apted_requirement() -> Requirement:
 
 
 # distance
-_DISTANCE_AVAILABLE = importlib.util.find_spec("distance") is not None
+_DISTANCE_AVAILABLE: Optional[bool] = None
 _DISTANCE_ERR_MSG = "distance must be installed: pip install distance"
 
 
@@ -196,7 +234,10 @@ def distance_available() -> bool:
     """
     Returns True if apted available
     """
-    return bool(_DISTANCE_AVAILABLE)
+    global _DISTANCE_AVAILABLE  # pylint: disable=W0603
+    if _DISTANCE_AVAILABLE is None:
+        _DISTANCE_AVAILABLE = _has_package("distance")
+    return _DISTANCE_AVAILABLE
 
 
 def get_distance_requirement() -> Requirement:
@@ -207,7 +248,7 @@ def get_distance_requirement() -> Requirement:
 
 
 # Transformers
-_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+_TRANSFORMERS_AVAILABLE: Optional[bool] = None
 _TRANSFORMERS_ERR_MSG = "Transformers must be installed: >>install-dd-pt"
 
 
@@ -215,7 +256,10 @@ def transformers_available() -> bool:
     """
     Returns True if HF Transformers is installed
     """
-    return bool(_TRANSFORMERS_AVAILABLE)
+    global _TRANSFORMERS_AVAILABLE  # pylint: disable=W0603
+    if _TRANSFORMERS_AVAILABLE is None:
+        _TRANSFORMERS_AVAILABLE = _has_package("transformers")
+    return _TRANSFORMERS_AVAILABLE
 
 
 def get_transformers_requirement() -> Requirement:
@@ -226,7 +270,7 @@ def get_transformers_requirement() -> Requirement:
 
 
 # Detectron2 related requirements
-_DETECTRON2_AVAILABLE = importlib.util.find_spec("detectron2") is not None
+_DETECTRON2_AVAILABLE: Optional[bool] = None
 _DETECTRON2_ERR_MSG = (
     "Detectron2 must be installed: Follow the official installation instructions "
     "https://detectron2.readthedocs.io/en/latest/tutorials/install.html"
@@ -237,7 +281,10 @@ def detectron2_available() -> bool:
     """
     Returns True if Detectron2 is installed
     """
-    return bool(_DETECTRON2_AVAILABLE)
+    global _DETECTRON2_AVAILABLE  # pylint: disable=W0603
+    if _DETECTRON2_AVAILABLE is None:
+        _DETECTRON2_AVAILABLE = _has_package("detectron2")
+    return _DETECTRON2_AVAILABLE
 
 
 def get_detectron2_requirement() -> Requirement:
@@ -248,7 +295,7 @@ def get_detectron2_requirement() -> Requirement:
 
 
 # Tesseract related dependencies
-_TESS_AVAILABLE = which("tesseract") is not None
+_TESS_AVAILABLE: Optional[bool] = None
 # Tesseract installation path
 _TESS_PATH = "tesseract"
 _TESS_ERR_MSG = "Tesseract >=4.0 must be installed: https://tesseract-ocr.github.io/tessdoc/Installation.html"
@@ -274,13 +321,17 @@ def set_tesseract_path(tesseract_path: str) -> None:
         _TESS_AVAILABLE = True
 
     _TESS_PATH = tesseract_path
+    get_tesseract_version.cache_clear()
 
 
 def tesseract_available() -> bool:
     """
     Returns True if Tesseract is installed
     """
-    return bool(_TESS_AVAILABLE)
+    global _TESS_AVAILABLE  # pylint: disable=W0603
+    if _TESS_AVAILABLE is None:
+        _TESS_AVAILABLE = _has_executable("tesseract")
+    return _TESS_AVAILABLE
 
 
 # copy paste from https://github.com/madmaze/pytesseract/blob/master/pytesseract/pytesseract.py
@@ -292,6 +343,7 @@ class TesseractNotFound(BaseException):
     """
 
 
+@functools.lru_cache(maxsize=1)
 def get_tesseract_version() -> Union[int, version.Version]:
     """
     Returns Version object of the Tesseract version. We need at least Tesseract 3.05
@@ -327,8 +379,8 @@ def get_tesseract_requirement() -> Requirement:
 
 
 # Poppler utils or resp. pdftoppm and pdftocairo for Linux platforms
-_PDF_TO_PPM_AVAILABLE = which("pdftoppm") is not None
-_PDF_TO_CAIRO_AVAILABLE = which("pdftocairo") is not None
+_PDF_TO_PPM_AVAILABLE: Optional[bool] = None
+_PDF_TO_CAIRO_AVAILABLE: Optional[bool] = None
 _POPPLER_ERR_MSG = "Poppler cannot be found. Please check that Poppler is installed and it is added to your path"
 
 
@@ -336,14 +388,20 @@ def pdf_to_ppm_available() -> bool:
     """
     Returns True if pdftoppm is installed
     """
-    return bool(_PDF_TO_PPM_AVAILABLE)
+    global _PDF_TO_PPM_AVAILABLE  # pylint: disable=W0603
+    if _PDF_TO_PPM_AVAILABLE is None:
+        _PDF_TO_PPM_AVAILABLE = _has_executable("pdftoppm")
+    return _PDF_TO_PPM_AVAILABLE
 
 
 def pdf_to_cairo_available() -> bool:
     """
     Returns True if pdftocairo is installed
     """
-    return bool(_PDF_TO_CAIRO_AVAILABLE)
+    global _PDF_TO_CAIRO_AVAILABLE  # pylint: disable=W0603
+    if _PDF_TO_CAIRO_AVAILABLE is None:
+        _PDF_TO_CAIRO_AVAILABLE = _has_executable("pdftocairo")
+    return _PDF_TO_CAIRO_AVAILABLE
 
 
 class PopplerNotFound(BaseException):
@@ -352,6 +410,7 @@ class PopplerNotFound(BaseException):
     """
 
 
+@functools.lru_cache(maxsize=1)
 def get_poppler_version() -> Union[int, version.Version]:
     """
     Returns Version object of the Poppler version. We need at least Tesseract 3.05
@@ -389,7 +448,7 @@ def get_poppler_requirement() -> Requirement:
 
 
 # Pdfplumber.six related dependencies
-_PDFPLUMBER_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
+_PDFPLUMBER_AVAILABLE: Optional[bool] = None
 _PDFPLUMBER_ERR_MSG = "pdfplumber must be installed. >> pip install pdfplumber"
 
 
@@ -397,7 +456,10 @@ def pdfplumber_available() -> bool:
     """
     Returns True if pdfplumber is installed
     """
-    return bool(_PDFPLUMBER_AVAILABLE)
+    global _PDFPLUMBER_AVAILABLE  # pylint: disable=W0603
+    if _PDFPLUMBER_AVAILABLE is None:
+        _PDFPLUMBER_AVAILABLE = _has_package("pdfplumber")
+    return _PDFPLUMBER_AVAILABLE
 
 
 def get_pdfplumber_requirement() -> Requirement:
@@ -408,7 +470,7 @@ def get_pdfplumber_requirement() -> Requirement:
 
 
 # pycocotools dependencies
-_COCOTOOLS_AVAILABLE = importlib.util.find_spec("pycocotools") is not None
+_COCOTOOLS_AVAILABLE: Optional[bool] = None
 _COCOTOOLS_ERR_MSG = "pycocotools must be installed. >> pip install pycocotools==2.0.4"
 
 
@@ -416,7 +478,10 @@ def cocotools_available() -> bool:
     """
     Returns True if pycocotools is installed
     """
-    return bool(_COCOTOOLS_AVAILABLE)
+    global _COCOTOOLS_AVAILABLE  # pylint: disable=W0603
+    if _COCOTOOLS_AVAILABLE is None:
+        _COCOTOOLS_AVAILABLE = _has_package("pycocotools")
+    return _COCOTOOLS_AVAILABLE
 
 
 def get_cocotools_requirement() -> Requirement:
@@ -427,18 +492,21 @@ def get_cocotools_requirement() -> Requirement:
 
 
 # scipy dependency
-_SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+_SCIPY_AVAILABLE: Optional[bool] = None
 
 
 def scipy_available() -> bool:
     """
     Returns True if scipy is installed
     """
-    return bool(_SCIPY_AVAILABLE)
+    global _SCIPY_AVAILABLE  # pylint: disable=W0603
+    if _SCIPY_AVAILABLE is None:
+        _SCIPY_AVAILABLE = _has_package("scipy")
+    return _SCIPY_AVAILABLE
 
 
 # jdeskew dependency
-_JDESKEW_AVAILABLE = importlib.util.find_spec("jdeskew") is not None
+_JDESKEW_AVAILABLE: Optional[bool] = None
 _JDESKEW_ERR_MSG = "jdeskew must be installed. >> pip install jdeskew"
 
 
@@ -446,7 +514,10 @@ def jdeskew_available() -> bool:
     """
     Returns True if jdeskew is installed
     """
-    return bool(_JDESKEW_AVAILABLE)
+    global _JDESKEW_AVAILABLE  # pylint: disable=W0603
+    if _JDESKEW_AVAILABLE is None:
+        _JDESKEW_AVAILABLE = _has_package("jdeskew")
+    return _JDESKEW_AVAILABLE
 
 
 def get_jdeskew_requirement() -> Requirement:
@@ -457,7 +528,7 @@ def get_jdeskew_requirement() -> Requirement:
 
 
 # scikit-learn dependencies
-_SKLEARN_AVAILABLE = importlib.util.find_spec("sklearn") is not None
+_SKLEARN_AVAILABLE: Optional[bool] = None
 _SKLEARN_ERR_MSG = "scikit-learn must be installed. >> pip install scikit-learn==1.0.2"
 
 
@@ -465,7 +536,10 @@ def sklearn_available() -> bool:
     """
     Returns True if sklearn is installed
     """
-    return bool(_SKLEARN_AVAILABLE)
+    global _SKLEARN_AVAILABLE  # pylint: disable=W0603
+    if _SKLEARN_AVAILABLE is None:
+        _SKLEARN_AVAILABLE = _has_package("sklearn")
+    return _SKLEARN_AVAILABLE
 
 
 def get_sklearn_requirement() -> Requirement:
@@ -476,21 +550,24 @@ def get_sklearn_requirement() -> Requirement:
 
 
 # qpdf related dependencies
-_QPDF_AVAILABLE = which("qpdf") is not None
+_QPDF_AVAILABLE: Optional[bool] = None
 
 
 def qpdf_available() -> bool:
     """
     Returns True if qpdf is installed
     """
-    return bool(_QPDF_AVAILABLE)
+    global _QPDF_AVAILABLE  # pylint: disable=W0603
+    if _QPDF_AVAILABLE is None:
+        _QPDF_AVAILABLE = _has_executable("qpdf")
+    return _QPDF_AVAILABLE
 
 
 # Textract related dependencies
-_BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
+_BOTO3_AVAILABLE: Optional[bool] = None
 _BOTO3_ERR_MSG = "Boto3 must be installed: >> pip install boto3"
 
-_AWS_CLI_AVAILABLE = which("aws") is not None
+_AWS_CLI_AVAILABLE: Optional[bool] = None
 _AWS_ERR_MSG = "AWS CLI must be installed https://docs.aws.amazon.com/cli/latest/userguide/getting-started-install.html"
 
 
@@ -498,8 +575,10 @@ def boto3_available() -> bool:
     """
     Returns True if Boto3 is installed
     """
-
-    return bool(_BOTO3_AVAILABLE)
+    global _BOTO3_AVAILABLE  # pylint: disable=W0603
+    if _BOTO3_AVAILABLE is None:
+        _BOTO3_AVAILABLE = _has_package("boto3")
+    return _BOTO3_AVAILABLE
 
 
 def get_boto3_requirement() -> Requirement:
@@ -513,7 +592,10 @@ def aws_available() -> bool:
     """
     Returns True if AWS CLI is installed
     """
-    return bool(_AWS_CLI_AVAILABLE)
+    global _AWS_CLI_AVAILABLE  # pylint: disable=W0603
+    if _AWS_CLI_AVAILABLE is None:
+        _AWS_CLI_AVAILABLE = _has_executable("aws")
+    return _AWS_CLI_AVAILABLE
 
 
 def get_aws_requirement() -> Requirement:
@@ -524,7 +606,7 @@ def get_aws_requirement() -> Requirement:
 
 
 # DocTr related dependencies
-_DOCTR_AVAILABLE = importlib.util.find_spec("doctr") is not None
+_DOCTR_AVAILABLE: Optional[bool] = None
 _DOCTR_ERR_MSG = (
     "DocTr must be installed. Please read the necessary requirements at https://github.com/mindee/doctr"
     "and use >> pip install python-doctr"
@@ -535,7 +617,10 @@ def doctr_available() -> bool:
     """
     Returns True if doctr is installed
     """
-    return bool(_DOCTR_AVAILABLE)
+    global _DOCTR_AVAILABLE  # pylint: disable=W0603
+    if _DOCTR_AVAILABLE is None:
+        _DOCTR_AVAILABLE = _has_package("doctr")
+    return _DOCTR_AVAILABLE
 
 
 def get_doctr_requirement() -> Requirement:
@@ -551,7 +636,7 @@ def get_doctr_requirement() -> Requirement:
 
 
 # Fasttext related dependencies
-_FASTTEXT_AVAILABLE = importlib.util.find_spec("fasttext") is not None
+_FASTTEXT_AVAILABLE: Optional[bool] = None
 _FASTTEXT_ERR_MSG = "Fasttext must be installed. >> pip install fasttext"
 
 
@@ -559,7 +644,10 @@ def fasttext_available() -> bool:
     """
     Returns True if fasttext is installed
     """
-    return bool(_FASTTEXT_AVAILABLE)
+    global _FASTTEXT_AVAILABLE  # pylint: disable=W0603
+    if _FASTTEXT_AVAILABLE is None:
+        _FASTTEXT_AVAILABLE = _has_package("fasttext")
+    return _FASTTEXT_AVAILABLE
 
 
 def get_fasttext_requirement() -> Requirement:
@@ -570,7 +658,7 @@ def get_fasttext_requirement() -> Requirement:
 
 
 # Wandb related dependencies
-_WANDB_AVAILABLE = importlib.util.find_spec("wandb") is not None
+_WANDB_AVAILABLE: Optional[bool] = None
 _WANDB_ERR_MSG = "WandB must be installed. >> pip install wandb"
 
 
@@ -578,7 +666,10 @@ def wandb_available() -> bool:
     """
     Returns True if W&B package wandb is installed
     """
-    return bool(_WANDB_AVAILABLE)
+    global _WANDB_AVAILABLE  # pylint: disable=W0603
+    if _WANDB_AVAILABLE is None:
+        _WANDB_AVAILABLE = _has_package("wandb")
+    return _WANDB_AVAILABLE
 
 
 def get_wandb_requirement() -> Requirement:
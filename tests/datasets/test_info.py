@@ -121,6 +121,57 @@ class TestDatasetCategories:
         }
         assert cats.is_filtered()
 
+    @staticmethod
+    @pytest.mark.basic
+    def test_categories_are_refreshed_after_update_and_filter() -> None:
+        """
+        Categories that have been requested before replacing/filtering are not returned afterwards
+        """
+
+        # Arrange
+        cats = TestDatasetCategories.setup()
+        assert cats.get_categories(filtered=True) == {"1": TestType.FOO, "2": TestType.BAK, "3": TestType.BAZ}
+
+        # Act
+        cats.set_cat_to_sub_cat({"BAK": "sub"})
+
+        # Assert
+        assert cats.get_categories(filtered=True) == {
+            "1": TestType.FOO,
+            "2": TestType.BAK_11,
+            "3": TestType.BAK_12,
+            "4": TestType.BAZ,
+        }
+
+        # Act
+        cats.filter_categories(categories=["FOO", "BAK_12"])
+
+        # Assert
+        assert cats.get_categories(filtered=True) == {"1": TestType.FOO, "2": TestType.BAK_12}
+
+    @staticmethod
+    @pytest.mark.basic
+    def test_get_categories_does_not_return_internal_state() -> None:
+        """
+        Modifying the returned categories or re-assigning updated categories is respected by later calls
+        """
+
+        # Arrange
+        cats = TestDatasetCategories.setup()
+        categories = cats.get_categories()
+
+        # Act
+        categories["1"] = TestType.BAK  # type: ignore
+
+        # Assert
+        assert cats.get_categories() == {"1": TestType.FOO, "2": TestType.BAK, "3": TestType.BAZ}
+
+        # Act
+        cats._categories_update = [TestType.BAZ, TestType.FOO]  # pylint: disable=W0212
+
+        # Assert
+        assert cats.get_categories() == {"1": TestType.BAZ, "2": TestType.FOO}
+
     @staticmethod
     @pytest.mark.basic
     def test_check_sub_categories() -> None:
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# File: test_file_utils.py
+
+# Copyright 2023 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing module utils.file_utils
+"""
+
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from deepdoctection.utils.file_utils import get_detectron2_requirement
+
+
+@mark.basic
+def test_requirement_follows_availability() -> None:
+    """
+    Requirements are evaluated on every call and follow the availability of the package
+    """
+
+    # Act & Assert
+    with patch("deepdoctection.utils.file_utils.detectron2_available", MagicMock(return_value=False)):
+        assert not get_detectron2_requirement()[1]
+    with patch("deepdoctection.utils.file_utils.detectron2_available", MagicMock(return_value=True)):
+        assert get_detectron2_requirement()[1]